@@ -1,22 +1,88 @@
 #!/usr/bin/env python3
 import os
 import sys
+import argparse
+import atexit
+import json
 import subprocess
 import shutil
+import tempfile
 import glob
 import re
-import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-def find_ffmpeg():
+CACHE_DIR = Path.home() / ".cache" / "create-video-preview"
+DURATION_CACHE_FILE = CACHE_DIR / "durations.json"
+CONFIG_DIR = Path.home() / ".config" / "create-video-preview"
+FFMPEG_PATH_FILE = CONFIG_DIR / "ffmpeg_path"
+
+WINDOWS_FFMPEG_LOCATIONS = [
+    r"C:\ffmpeg*\bin\ffmpeg.exe",
+    r"C:\Program Files\ffmpeg*\bin\ffmpeg.exe",
+    r"C:\Program Files (x86)\ffmpeg*\bin\ffmpeg.exe",
+    r"C:\ProgramData\chocolatey\bin\ffmpeg.exe",
+    r"~\scoop\apps\ffmpeg\current\bin\ffmpeg.exe",
+    r"~\AppData\Local\Microsoft\WinGet\Packages\*FFmpeg*\*\bin\ffmpeg.exe",
+]
+
+# Unpacked release builds, e.g. ~\Downloads\ffmpeg-7.0-full_build\bin\ffmpeg.exe
+WINDOWS_FFMPEG_HOME_PATTERNS = [
+    r"~\ffmpeg*\bin\ffmpeg.exe",
+    r"~\*\ffmpeg*\bin\ffmpeg.exe",
+    r"~\*\*\ffmpeg*\bin\ffmpeg.exe",
+]
+
+VIDEO_ENCODE_ARGS = ('-c:v', 'libx264', '-crf', '23')
+MAX_AUDIO_BIT_RATE = 320000
+
+# Bytes patterns so ffmpeg's stderr can be searched without decoding it
+_DURATION_RE = re.compile(rb'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)')
+_AUDIO_STREAM_RE = re.compile(rb'Stream #\d+:\d+.*?: Audio: \w+(?:[^\n]*?(\d+) kb/s)?')
+
+_duration_cache = None
+_duration_cache_dirty = False
+
+def load_saved_ffmpeg_path():
+    """Return the previously chosen ffmpeg if it is still executable, else None"""
+    try:
+        saved_path = FFMPEG_PATH_FILE.read_text().strip()
+    except OSError:
+        return None
+    if saved_path and os.path.isfile(saved_path) and os.access(saved_path, os.X_OK):
+        return saved_path
+    return None
+
+def save_ffmpeg_path(ffmpeg_path):
+    """Remember the chosen ffmpeg for later runs"""
+    try:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        FFMPEG_PATH_FILE.write_text(ffmpeg_path + "\n")
+    except OSError as e:
+        print(f"Warning: Could not save ffmpeg path: {e}")
+
+def find_ffmpeg(reconfigure=False):
+    """Find ffmpeg executable, reusing the saved choice unless reconfiguring"""
+    if not reconfigure:
+        saved_path = load_saved_ffmpeg_path()
+        if saved_path:
+            return saved_path
+    
+    ffmpeg_path = choose_ffmpeg()
+    save_ffmpeg_path(ffmpeg_path)
+    return ffmpeg_path
+
+def choose_ffmpeg():
     """Find ffmpeg executable and let user choose"""
     all_paths = []
+    seen = set()  # Resolved paths, so symlinks and repeated where/which hits coalesce
     
     # Check PATH first
     ffmpeg_path = shutil.which('ffmpeg')
     if ffmpeg_path:
         all_paths.append(("PATH", ffmpeg_path))
+        seen.add(os.path.realpath(ffmpeg_path))
         print(f"Found ffmpeg in PATH: {ffmpeg_path}")
     else:
         print("ffmpeg not found in PATH")
@@ -32,34 +98,36 @@ def find_ffmpeg():
             paths = result.stdout.strip().split('\n')
             for path in paths:
                 path = path.strip()
-                if path not in [p[1] for p in all_paths]:  # Avoid duplicates
+                if path and os.path.realpath(path) not in seen:  # Avoid duplicates
                     all_paths.append(("System", path))
+                    seen.add(os.path.realpath(path))
     except Exception:
         pass
     
     # Search common directories if no PATH version found
     if not any(source == "PATH" for source, _ in all_paths):
         print("Searching for ffmpeg in system directories...")
-        search_dirs = []
         
         if os.name == 'nt':  # Windows
-            # Search Program Files and common download locations
-            for root_dir in [r"C:\Program Files", r"C:\Program Files (x86)", os.path.expanduser("~")]:
-                if os.path.exists(root_dir):
-                    for root, dirs, files in os.walk(root_dir):
-                        if 'ffmpeg.exe' in files:
-                            full_path = os.path.join(root, 'ffmpeg.exe')
-                            if full_path not in [p[1] for p in all_paths]:  # Avoid duplicates
-                                all_paths.append(("Found", full_path))
-                        # Limit depth to avoid long searches
-                        if root.count(os.sep) - root_dir.count(os.sep) > 3:
-                            dirs.clear()
+            # Check known install locations before falling back to a shallow home search
+            for pattern in WINDOWS_FFMPEG_LOCATIONS:
+                for full_path in glob.iglob(os.path.expanduser(pattern)):
+                    if os.path.realpath(full_path) not in seen:  # Avoid duplicates
+                        all_paths.append(("Found", full_path))
+                        seen.add(os.path.realpath(full_path))
+            
+            if not all_paths:
+                for pattern in WINDOWS_FFMPEG_HOME_PATTERNS:
+                    full_path = next(glob.iglob(os.path.expanduser(pattern)), None)
+                    if full_path:
+                        all_paths.append(("Found", full_path))
+                        break
     
     if not all_paths:
         raise FileNotFoundError("ffmpeg not found. Please install ffmpeg or add it to PATH.")
     
-    # If only one path found (and it's in PATH), use it automatically
-    if len(all_paths) == 1 and all_paths[0][0] == "PATH":
+    # If only one installation found, use it automatically
+    if len(all_paths) == 1:
         return all_paths[0][1]
     
     # Let user choose which ffmpeg to use
@@ -97,13 +165,13 @@ def get_video_duration(ffmpeg_path, video_path):
     try:
         result = subprocess.run([
             ffmpeg_path, '-i', video_path
-        ], capture_output=True, text=True)
+        ], capture_output=True)
         
         # Parse duration from ffmpeg output (ffmpeg outputs to stderr)
         output = result.stderr if result.stderr else result.stdout
-        duration_match = re.search(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)', output)
+        duration_match = _DURATION_RE.search(output)
         if duration_match:
-            hours, minutes, seconds_str = duration_match.groups()
+            hours, minutes, seconds_str = (group.decode('ascii') for group in duration_match.groups())
             hours, minutes = int(hours), int(minutes)
             seconds = float(seconds_str)
             return int(hours * 3600 + minutes * 60 + seconds)
@@ -112,30 +180,166 @@ def get_video_duration(ffmpeg_path, video_path):
     except subprocess.SubprocessError as e:
         raise RuntimeError(f"Failed to get video duration: {e}")
 
-def select_video_file(ffmpeg_path):
-    """Interactive video file selection with duration info"""
-    video_files = glob.glob("*.mp4")
+def find_ffprobe(ffmpeg_path):
+    """Find the ffprobe executable that sits next to the chosen ffmpeg"""
+    ffmpeg_dir, ffmpeg_name = os.path.split(ffmpeg_path)
+    ffprobe_path = os.path.join(ffmpeg_dir, ffmpeg_name.replace('ffmpeg', 'ffprobe'))
+    if ffprobe_path != ffmpeg_path and os.path.isfile(ffprobe_path):
+        return ffprobe_path
+    return shutil.which('ffprobe')
+
+def get_video_duration_ffprobe(ffprobe_path, video_path):
+    """Get video duration in seconds using ffprobe"""
+    try:
+        result = subprocess.run([
+            ffprobe_path, '-v', 'error',
+            '-show_entries', 'format=duration',
+            '-of', 'default=nw=1:nk=1',
+            video_path
+        ], capture_output=True, text=True)
+        return int(float(result.stdout.strip().splitlines()[0]))
+    except (IndexError, ValueError):
+        raise ValueError("Could not parse video duration")
+    except subprocess.SubprocessError as e:
+        raise RuntimeError(f"Failed to get video duration: {e}")
+
+def get_audio_bit_rate(ffmpeg_path, video_path):
+    """Get the bit rate of the first audio stream, 0 if unknown, or None if there is no audio"""
+    ffprobe_path = find_ffprobe(ffmpeg_path)
+    if ffprobe_path:
+        result = subprocess.run([
+            ffprobe_path, '-v', 'error',
+            '-select_streams', 'a:0',
+            '-show_entries', 'stream=codec_name,bit_rate',
+            '-of', 'default=nw=1',
+            video_path
+        ], capture_output=True, text=True)
+        fields = dict(line.split('=', 1) for line in result.stdout.splitlines() if '=' in line)
+        if not fields.get('codec_name'):
+            return None
+        bit_rate = fields.get('bit_rate', '')
+        return int(bit_rate) if bit_rate.isdigit() else 0
+    
+    # Fall back to the stream summary ffmpeg prints for its input
+    result = subprocess.run([ffmpeg_path, '-i', video_path], capture_output=True)
+    audio_match = _AUDIO_STREAM_RE.search(result.stderr)
+    if not audio_match:
+        return None
+    kbps = audio_match.group(1)
+    return int(kbps) * 1000 if kbps else 0
+
+def load_duration_cache():
+    """Load the on-disk duration cache, registering it to be saved at exit"""
+    global _duration_cache
+    if _duration_cache is None:
+        try:
+            with open(DURATION_CACHE_FILE) as f:
+                _duration_cache = json.load(f)
+        except (OSError, ValueError):
+            _duration_cache = {}
+        if not isinstance(_duration_cache, dict):
+            _duration_cache = {}
+        atexit.register(save_duration_cache)
+    return _duration_cache
+
+def save_duration_cache():
+    """Write the duration cache back to disk if it changed"""
+    if not _duration_cache_dirty:
+        return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(DURATION_CACHE_FILE, 'w') as f:
+            json.dump(_duration_cache, f)
+    except OSError as e:
+        print(f"Warning: Could not save duration cache: {e}")
+
+def lookup_cached_duration(video_path, stat_result):
+    """Return the cached duration for an unchanged file, or None"""
+    entry = load_duration_cache().get(os.path.abspath(video_path))
+    if (isinstance(entry, list) and len(entry) == 2
+            and entry[0] == f"{stat_result.st_size}:{stat_result.st_mtime_ns}"
+            and isinstance(entry[1], int) and not isinstance(entry[1], bool)):
+        return entry[1]
+    return None
+
+def store_cached_duration(video_path, stat_result, duration):
+    """Remember a probed duration keyed by file size and modification time"""
+    global _duration_cache_dirty
+    key = f"{stat_result.st_size}:{stat_result.st_mtime_ns}"
+    load_duration_cache()[os.path.abspath(video_path)] = [key, duration]
+    _duration_cache_dirty = True
+
+def get_video_duration_cached(ffmpeg_path, video_path, stat_result=None):
+    """Get video duration, skipping the probe if the file is unchanged since last run"""
+    if stat_result is None:
+        stat_result = os.stat(video_path)
+    duration = lookup_cached_duration(video_path, stat_result)
+    if duration is None:
+        duration = get_video_duration(ffmpeg_path, video_path)
+        store_cached_duration(video_path, stat_result, duration)
+    return duration
+
+def get_durations_batch(ffmpeg_path, video_files, stat_results=None):
+    """Get durations for several videos at once, None where unknown"""
+    if stat_results is None:
+        stat_results = [os.stat(video_file) for video_file in video_files]
+    durations = [lookup_cached_duration(video_file, st) for video_file, st in zip(video_files, stat_results)]
+    missing = [i for i, duration in enumerate(durations) if duration is None]
+    if not missing:
+        return durations
+    
+    ffprobe_path = find_ffprobe(ffmpeg_path)
+
+    def probe(video_path):
+        try:
+            if ffprobe_path:
+                return get_video_duration_ffprobe(ffprobe_path, video_path)
+            return get_video_duration(ffmpeg_path, video_path)
+        except Exception:
+            return None
+
+    # ffprobe only accepts a single input, so overlap the probes instead
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        probed = executor.map(probe, [video_files[i] for i in missing])
+        for i, duration in zip(missing, probed):
+            durations[i] = duration
+            if duration is not None:
+                store_cached_duration(video_files[i], stat_results[i], duration)
+    return durations
+
+def select_video_file(ffmpeg_path, show_durations=False):
+    """Interactive video file selection, probing durations only when needed"""
+    with os.scandir('.') as entries:
+        video_entries = [
+            entry for entry in entries
+            if entry.is_file() and entry.name.lower().endswith('.mp4') and not entry.name.startswith('.')
+        ]
+    video_files = [entry.name for entry in video_entries]
     
     if not video_files:
         print("No MP4 files found in current directory.")
         sys.exit(1)
     
     print("Please select the video file you want to process:")
-    print("Getting video durations...")
+    # DirEntry.stat() reuses the data from the directory listing on Windows
+    stat_results = [entry.stat() for entry in video_entries]
+    if show_durations:
+        print("Getting video durations...")
+        durations = get_durations_batch(ffmpeg_path, video_files, stat_results)
+    else:
+        # Only show what is already cached; the chosen file is probed below
+        durations = [lookup_cached_duration(video_file, st) for video_file, st in zip(video_files, stat_results)]
     
-    video_info = []
-    for i, video_file in enumerate(video_files, 1):
-        file_path = Path(video_file)
-        size_mb = round(file_path.stat().st_size / (1024 * 1024), 2)
-        modified_time = datetime.fromtimestamp(file_path.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
+    for i, (video_file, st, duration) in enumerate(zip(video_files, stat_results, durations), 1):
+        size_mb = round(st.st_size / (1024 * 1024), 2)
+        modified_time = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M")
         
-        try:
-            duration = get_video_duration(ffmpeg_path, video_file)
+        if duration is not None:
             duration_str = format_duration(duration)
-            video_info.append((video_file, duration))
-        except Exception:
+        elif show_durations:
             duration_str = "Unknown"
-            video_info.append((video_file, 0))
+        else:
+            duration_str = "--:--:--"
         
         print(f"[{i}] {video_file} - {duration_str} - {modified_time} - {size_mb} MB")
     
@@ -143,11 +347,17 @@ def select_video_file(ffmpeg_path):
         try:
             choice = int(input("Enter the number: "))
             if 1 <= choice <= len(video_files):
-                return video_info[choice - 1]
+                break
             else:
                 print("Invalid selection. Please enter a valid number.")
         except ValueError:
             print("Invalid selection. Please enter a valid number.")
+    
+    video_file = video_files[choice - 1]
+    duration = durations[choice - 1]
+    if duration is None:
+        duration = get_video_duration_cached(ffmpeg_path, video_file, stat_results[choice - 1])
+    return video_file, duration
 
 def handle_existing_file(output_path):
     """Handle existing output file with user choices"""
@@ -185,6 +395,13 @@ def get_clip_length():
         except ValueError:
             print("Please enter a valid number.")
 
+def get_preview_duration(duration, percentage):
+    """Get the preview length in whole seconds for a percentage of the video, rounding halves up"""
+    if percentage == int(percentage):
+        # Whole percentages, including every row of the example table, stay in integers
+        return (duration * int(percentage) * 2 + 100) // 200
+    return int(duration * percentage / 100 + 0.5)
+
 def get_preview_percentage(duration, clip_length):
     """Get preview percentage from user with examples"""
     print(f"\nOriginal video duration: {format_duration(duration)}")
@@ -193,139 +410,132 @@ def get_preview_percentage(duration, clip_length):
     
     percentages = [5, 10, 15, 20, 25]
     for pct in percentages:
-        preview_time = duration * (pct / 100)
-        num_clips = math.ceil(preview_time / clip_length)
-        print(f"  {pct}% would be {format_duration(preview_time)} ({num_clips} clips)")
+        preview_secs = get_preview_duration(duration, pct)
+        num_clips = -(-preview_secs // clip_length)  # Integer ceiling division
+        print(f"  {pct}% would be {format_duration(preview_secs)} ({num_clips} clips)")
     
     while True:
         try:
             percentage = float(input("\nEnter percentage (1-50): "))
             if 1 <= percentage <= 50:
-                preview_duration = round(duration * (percentage / 100))
-                num_clips = math.ceil(preview_duration / clip_length)
+                preview_duration = get_preview_duration(duration, percentage)
+                num_clips = -(-preview_duration // clip_length)
                 print(f"Preview will be {format_duration(preview_duration)} ({percentage}% of original, {num_clips} clips)")
-                return percentage / 100
+                return percentage
             else:
                 print("Please enter a percentage between 1 and 50.")
         except ValueError:
             print("Please enter a valid number.")
 
-def create_preview_clips(ffmpeg_path, input_video, clips_dir, duration, preview_duration, clip_length):
-    """Extract preview clips from video"""
-    number_of_clips = math.ceil(preview_duration / clip_length)
-    clip_paths = []
+def build_preview_filter(clip_times, has_audio):
+    """Build a filter graph that trims each clip from the input and concatenates them"""
+    streams = [('v', 'trim', 'setpts')]
+    if has_audio:
+        streams.append(('a', 'atrim', 'asetpts'))
     
-    print(f"Extracting {number_of_clips} clips of {clip_length} seconds each...")
+    filters = []
+    concat_inputs = []
+    for i, (start_time, end_time) in enumerate(clip_times):
+        for kind, trim, setpts in streams:
+            filters.append(f"[0:{kind}]{trim}=start={start_time}:end={end_time},{setpts}=PTS-STARTPTS[{kind}{i}]")
+            concat_inputs.append(f"[{kind}{i}]")
     
+    outputs = "".join(f"[out{kind}]" for kind, _, _ in streams)
+    filters.append(f"{''.join(concat_inputs)}concat=n={len(clip_times)}:v=1:a={int(has_audio)}{outputs}")
+    return ";".join(filters)
+
+def create_preview(ffmpeg_path, input_video, output_preview, duration, preview_duration, clip_length):
+    """Trim preview clips from video and join them in a single ffmpeg pass"""
+    number_of_clips = -(-preview_duration // clip_length)
+    clip_times = []
+    
+    # Whole seconds, and never so late that the last clip would come out short
+    last_start = max(0, duration - clip_length)
     for i in range(number_of_clips):
-        start_time = (duration / number_of_clips) * i
-        clip_path = clips_dir / f"clip{i}.mp4"
-        
-        cmd = [
-            ffmpeg_path,
-            '-ss', str(start_time),
-            '-t', str(clip_length),
-            '-i', input_video,
-            '-c:v', 'libx264',
-            '-crf', '10',
-            '-c:a', 'aac',
-            '-b:a', '320k',
-            '-shortest',
-            str(clip_path)
-        ]
-        
-        try:
-            subprocess.run(cmd, check=True, capture_output=True)
-            clip_paths.append(clip_path)
-            print(f"Extracted clip {i+1}/{number_of_clips}")
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to extract clip {i}: {e}")
+        start_time = min((duration * i) // number_of_clips, last_start)
+        clip_times.append((start_time, start_time + clip_length))
+    
+    # The graph needs to know up front whether there is an audio stream to trim
+    source_bit_rate = get_audio_bit_rate(ffmpeg_path, input_video)
+    has_audio = source_bit_rate is not None
+    
+    # The graph grows with every clip, so it goes in a script file rather than on
+    # the command line, which is limited to 32K characters on Windows
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as filter_script:
+        filter_script.write(build_preview_filter(clip_times, has_audio))
     
-    return clip_paths
-
-def create_concat_file(clip_paths, concat_file_path):
-    """Create ffmpeg concat file"""
-    with open(concat_file_path, 'w') as f:
-        for clip_path in clip_paths:
-            # Use forward slashes for ffmpeg compatibility
-            abs_path = str(clip_path.resolve()).replace('\\', '/')
-            f.write(f"file '{abs_path}'\n")
-
-def combine_clips(ffmpeg_path, concat_file_path, output_preview):
-    """Combine clips into final preview video"""
+    # Only errors are logged, so stderr stays small enough to keep for diagnostics
     cmd = [
         ffmpeg_path,
-        '-f', 'concat',
-        '-safe', '0',
-        '-i', str(concat_file_path),
-        '-c', 'copy',
-        output_preview
+        '-v', 'error',
+        '-i', input_video,
+        '-filter_complex_script', filter_script.name,
+        '-map', '[outv]',
     ]
+    if has_audio:
+        # Trimmed audio has to be re-encoded, so -c:a copy is not possible; at least
+        # never encode above the source bit rate
+        audio_bit_rate = min(source_bit_rate or MAX_AUDIO_BIT_RATE, MAX_AUDIO_BIT_RATE)
+        cmd += ['-map', '[outa]', '-c:a', 'aac', '-b:a', str(audio_bit_rate)]
+    cmd += [*VIDEO_ENCODE_ARGS, output_preview]
+    
+    print(f"Creating preview from {number_of_clips} clips of {clip_length} seconds each...")
     
     try:
-        subprocess.run(cmd, check=True, capture_output=True)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         print(f"Preview created: {output_preview}")
     except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to combine clips: {e}")
+        details = e.stderr.decode(errors='replace').strip()
+        raise RuntimeError(f"Failed to create preview: {details or e}")
+    finally:
+        os.remove(filter_script.name)
 
-def cleanup_temp_files(clips_dir, concat_file_path):
-    """Clean up temporary files and directories"""
-    try:
-        if clips_dir.exists():
-            shutil.rmtree(clips_dir)
-        if concat_file_path.exists():
-            concat_file_path.unlink()
-        print("Temporary files cleaned up.")
-    except Exception as e:
-        print(f"Warning: Could not clean up temporary files: {e}")
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Create a preview video from clips spread throughout a video file.")
+    parser.add_argument('video', nargs='?', help="video file to process (prompts with a list of MP4 files if omitted)")
+    parser.add_argument('--reconfigure-ffmpeg', action='store_true',
+                        help="ignore the saved ffmpeg location and search again")
+    parser.add_argument('--show-durations', action='store_true',
+                        help="probe the duration of every MP4 before asking which one to use")
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+    
     try:
         # Find ffmpeg
-        ffmpeg_path = find_ffmpeg()
+        ffmpeg_path = find_ffmpeg(reconfigure=args.reconfigure_ffmpeg)
         print(f"Using ffmpeg at: {ffmpeg_path}")
         
         # Get input video
-        if len(sys.argv) > 1:
-            input_video = sys.argv[1]
+        if args.video:
+            input_video = args.video
             if not os.path.exists(input_video):
                 print(f"Error: Video file '{input_video}' not found.")
                 sys.exit(1)
-            duration = get_video_duration(ffmpeg_path, input_video)
+            duration = get_video_duration_cached(ffmpeg_path, input_video)
         else:
-            input_video, duration = select_video_file(ffmpeg_path)
+            input_video, duration = select_video_file(ffmpeg_path, args.show_durations)
         
         # Get clip length from user
         clip_length = get_clip_length()
         
         # Get preview percentage from user
         preview_percentage = get_preview_percentage(duration, clip_length)
-        preview_duration = round(duration * preview_percentage)
+        preview_duration = get_preview_duration(duration, preview_percentage)
         
         # Create output filename
         input_path = Path(input_video)
         output_preview = str(input_path.parent / f"{input_path.stem} sampler.mp4")
         output_preview = handle_existing_file(output_preview)
         
-        # Create temporary directory
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S%f")[:-3]
-        clips_dir = Path(f"clips_{timestamp}")
-        clips_dir.mkdir(exist_ok=True)
-        
-        # Create preview clips
-        clip_paths = create_preview_clips(
-            ffmpeg_path, input_video, clips_dir, 
+        # Create preview
+        create_preview(
+            ffmpeg_path, input_video, output_preview,
             duration, preview_duration, clip_length
         )
         
-        # Create concat file and combine clips
-        concat_file_path = Path("concat.txt")
-        create_concat_file(clip_paths, concat_file_path)
-        combine_clips(ffmpeg_path, concat_file_path, output_preview)
-        
-        # Clean up
-        cleanup_temp_files(clips_dir, concat_file_path)
-        
         print("Preview creation completed successfully!")
         
     except Exception as e: